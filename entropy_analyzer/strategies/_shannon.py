@@ -0,0 +1,40 @@
+"""
+Shannon Entropy Helper Module.
+
+This module provides the shared Shannon entropy reduction used by the entropy
+strategies. It replaces scipy.stats.entropy on the hot paths: the strategies
+already produce non-negative weight arrays, so the per-call scipy dispatch,
+argument checking, and base conversion are pure overhead.
+
+The module is designed to be:
+- Minimal: A single vectorized reduction.
+- Safe: Zero weights are filtered instead of special-cased.
+- Consistent: Always returns entropy in bits.
+
+Author: Aditya Patange (AdiPat)
+License: MIT
+"""
+
+import numpy as np
+
+
+def shannon_bits(weights) -> float:
+    """Compute Shannon entropy in bits for an array of non-negative weights.
+
+    Weights are normalized to probabilities internally, so callers may pass
+    unnormalized histograms or interval arrays directly. Non-positive entries
+    contribute zero to the reduction.
+
+    Args:
+        weights: Array-like of non-negative weights or probabilities.
+
+    Returns:
+        float: Shannon entropy of the normalized distribution in bits.
+    """
+    p = np.asarray(weights, dtype=np.float64)
+    total = p.sum()
+    if total <= 0:
+        return 0.0
+    p = p / total
+    logs = np.log2(p, where=p > 0, out=np.zeros_like(p))
+    return float(-(p * logs).sum())
@@ -0,0 +1,73 @@
+"""
+Time Entropy Kernel Module.
+
+This module holds the optional compiled kernel behind TimeEntropy. The core
+computation - interval diffs, peak-to-peak range, normalization, and the
+Shannon reduction - is a chain of small NumPy passes with one temporary array
+each; fusing them into a single compiled function removes the temporaries and
+lets the loops autovectorize.
+
+The module is designed to be:
+- Optional: numba is not a required dependency.
+- Fused: One kernel covers diff, range, and entropy.
+- Drop-in: TimeEntropy falls back to the NumPy path when absent.
+
+Author: Aditya Patange (AdiPat)
+License: MIT
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def time_entropy_bits(times):
+        """Compute interval entropy (in bits) for sorted epoch times.
+
+        Fuses the interval diff, min/max range, normalization, and
+        -sum(p*log2(p)) reduction into compiled loops over the times array,
+        allocating no intermediate arrays. Non-positive normalized intervals
+        are skipped, so no epsilon shift is needed.
+
+        Args:
+            times: Contiguous float64 array of epoch seconds.
+
+        Returns:
+            float: Shannon entropy of the normalized interval distribution
+                in bits.
+        """
+        m = times.size - 1
+        if m < 1:
+            return 0.0
+        mn = times[1] - times[0]
+        mx = mn
+        for i in range(m):
+            d = times[i + 1] - times[i]
+            if d < mn:
+                mn = d
+            elif d > mx:
+                mx = d
+        rng = mx - mn
+        if rng == 0.0:
+            return 0.0
+        total = 0.0
+        for i in range(m):
+            total += (times[i + 1] - times[i]) / rng
+        if total <= 0.0:
+            return 0.0
+        h = 0.0
+        for i in range(m):
+            v = ((times[i + 1] - times[i]) / rng) / total
+            if v > 0.0:
+                h -= v * np.log2(v)
+        return h
+
+    time_entropy_bits(np.zeros(2, dtype=np.float64))
+else:
+    time_entropy_bits = None
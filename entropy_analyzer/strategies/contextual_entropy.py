@@ -14,13 +14,92 @@ Author: Aditya Patange (AdiPat)
 License: MIT
 """
 
-from typing import Optional
+import asyncio
+import functools
+from typing import TYPE_CHECKING, List, Optional
 
-from openai import OpenAI
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
 from .entropy_strategy_base import EntropyStrategy
 from .text_entropy import TextEntropy
 
+# cl100k_base token ids for the single digits "0".."9". Biasing these keeps
+# the one-token completion a parseable digit: "10" encodes as two tokens, so
+# an unconstrained reply could be silently truncated by max_tokens=1 and
+# force the TextEntropy fallback.
+_DIGIT_TOKEN_IDS = tuple(range(15, 25))
+
+
+def _request_score(client: "OpenAI", model: str, text: str) -> float:
+    """Request an unpredictability score for text from the language model.
+
+    Args:
+        client: OpenAI client used for the request.
+        model: Model identifier to query.
+        text: Text to score.
+
+    Returns:
+        float: Normalized entropy score between 0 and 1.
+    """
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {
+                "role": "system",
+                "content": "Rate text unpredictability from 0-9",
+            },
+            {"role": "user", "content": text},
+        ],
+        max_tokens=1,
+        logit_bias={tid: 100 for tid in _DIGIT_TOKEN_IDS},
+    )
+    return float(response.choices[0].message.content.strip()) / 10.0
+
+
+async def _arequest_score(client: "AsyncOpenAI", model: str, text: str) -> float:
+    """Request an unpredictability score asynchronously.
+
+    Args:
+        client: AsyncOpenAI client used for the request.
+        model: Model identifier to query.
+        text: Text to score.
+
+    Returns:
+        float: Normalized entropy score between 0 and 1.
+    """
+    response = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {
+                "role": "system",
+                "content": "Rate text unpredictability from 0-9",
+            },
+            {"role": "user", "content": text},
+        ],
+        max_tokens=1,
+        logit_bias={tid: 100 for tid in _DIGIT_TOKEN_IDS},
+    )
+    return float(response.choices[0].message.content.strip()) / 10.0
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_score(model: str, text: str) -> float:
+    """Score text via the API, memoizing results by model and content.
+
+    Repeated inputs return instantly with no network round trip. Failed
+    requests raise and are not cached, so transient API errors do not
+    poison the cache.
+
+    Args:
+        model: Model identifier to query.
+        text: Text to score.
+
+    Returns:
+        float: Normalized entropy score between 0 and 1.
+    """
+    return _request_score(ContextualEntropy._get_client(), model, text)
+
 
 class ContextualEntropy(EntropyStrategy):
     """Strategy for analyzing text entropy using contextual language models.
@@ -31,8 +110,9 @@ class ContextualEntropy(EntropyStrategy):
     frequencies.
 
     The analysis is performed by querying a language model to rate the text's
-    unpredictability. If the API call fails, it falls back to basic text
-    entropy calculation.
+    unpredictability. Results for the default client are cached so
+    repeated inputs avoid network round trips. If the API call fails,
+    it falls back to basic text entropy calculation.
 
     Attributes:
         None
@@ -42,11 +122,45 @@ class ContextualEntropy(EntropyStrategy):
         >>> score = analyzer.compute_entropy("Some text to analyze")
     """
 
-    def compute_entropy(self, text: Optional[str], client: OpenAI = None) -> float:
+    _default_client: Optional["OpenAI"] = None
+    _default_async_client: Optional["AsyncOpenAI"] = None
+
+    @classmethod
+    def _get_client(cls) -> "OpenAI":
+        """Return the shared default client, creating it on first use.
+
+        Reusing a single client keeps the underlying connection pool alive
+        across calls, avoiding a TCP/TLS handshake per request.
+
+        Returns:
+            OpenAI: The shared default client.
+        """
+        if cls._default_client is None:
+            from openai import OpenAI
+
+            cls._default_client = OpenAI()
+        return cls._default_client
+
+    @classmethod
+    def _get_async_client(cls) -> "AsyncOpenAI":
+        """Return the shared default async client, creating it on first use.
+
+        Returns:
+            AsyncOpenAI: The shared default async client.
+        """
+        if cls._default_async_client is None:
+            from openai import AsyncOpenAI
+
+            cls._default_async_client = AsyncOpenAI()
+        return cls._default_async_client
+
+    def compute_entropy(self, text: Optional[str], client: "OpenAI" = None) -> float:
         """Compute entropy score for given text using contextual analysis.
 
         Args:
             text: Input text to analyze. Can be None.
+            client: Optional OpenAI client. Explicitly provided clients bypass
+                the response cache.
 
         Returns:
             float: Normalized entropy score between 0 and 1.
@@ -61,20 +175,138 @@ class ContextualEntropy(EntropyStrategy):
         if not text:
             return 0.0
 
+        try:
+            if client:
+                return _request_score(client, "gpt-3.5-turbo", text)
+            return _cached_score("gpt-3.5-turbo", text)
+        except Exception:
+            return TextEntropy().compute_entropy(text)
+
+    def compute_entropy_batch(
+        self, texts: Optional[List[str]], client: "OpenAI" = None
+    ) -> List[float]:
+        """Compute entropy scores for many texts in a single API request.
+
+        Submits all texts as one numbered prompt and parses one rating per
+        line, amortizing request latency and rate limits over the batch
+        instead of paying one round trip per text.
+
+        Args:
+            texts: List of texts to analyze. Can be None.
+            client: Optional OpenAI client to use for the request.
+
+        Returns:
+            List[float]: Normalized entropy scores between 0 and 1, one per
+                input text, in input order.
+
+        Raises:
+            ValueError: If input is not a list of strings or None.
+        """
+        if not isinstance(texts, list) and texts is not None:
+            raise ValueError("Input must be a list of strings or None")
+
+        if not texts:
+            return []
+
+        if not all(isinstance(t, str) for t in texts):
+            raise ValueError("All elements must be strings")
+
         try:
             if not client:
-                client = OpenAI()
+                client = self._get_client()
+            numbered = "\n".join(f"{i + 1}. {t}" for i, t in enumerate(texts))
             response = client.chat.completions.create(
                 model="gpt-3.5-turbo",
                 messages=[
                     {
                         "role": "system",
-                        "content": "Rate text unpredictability from 0-10",
+                        "content": (
+                            f"Return {len(texts)} integers 0-9, one per line, "
+                            f"rating the unpredictability of the following "
+                            f"{len(texts)} texts"
+                        ),
                     },
-                    {"role": "user", "content": text},
+                    {"role": "user", "content": numbered},
                 ],
-                max_tokens=1,
+                max_tokens=2 * len(texts),
             )
-            return float(response.choices[0].message.content.strip()) / 10.0
+            lines = response.choices[0].message.content.strip().splitlines()
+            scores = [float(line.strip()) / 10.0 for line in lines]
+            if len(scores) != len(texts):
+                raise ValueError("Score count does not match text count")
+            return scores
+        except Exception:
+            fallback = TextEntropy()
+            return [fallback.compute_entropy(t) for t in texts]
+
+    async def acompute_entropy(
+        self, text: Optional[str], client: "AsyncOpenAI" = None
+    ) -> float:
+        """Compute entropy score for given text asynchronously.
+
+        Args:
+            text: Input text to analyze. Can be None.
+            client: Optional AsyncOpenAI client to use for the request.
+
+        Returns:
+            float: Normalized entropy score between 0 and 1.
+
+        Raises:
+            ValueError: If input is neither a string nor None.
+        """
+        if not isinstance(text, str) and text is not None:
+            raise ValueError("Input must be a string or None")
+
+        if not text:
+            return 0.0
+
+        try:
+            if not client:
+                client = self._get_async_client()
+            return await _arequest_score(client, "gpt-3.5-turbo", text)
         except Exception:
             return TextEntropy().compute_entropy(text)
+
+    def compute_entropy_many(
+        self,
+        texts: Optional[List[str]],
+        client: "AsyncOpenAI" = None,
+        concurrency: int = 16,
+    ) -> List[float]:
+        """Compute entropy scores for many texts with concurrent requests.
+
+        Scoring is network-bound, so sequential calls waste one round trip
+        per text. This fires requests concurrently through the async client,
+        bounded by a semaphore to stay within rate limits.
+
+        Args:
+            texts: List of texts to analyze. Can be None.
+            client: Optional AsyncOpenAI client to use for the requests.
+            concurrency: Maximum number of in-flight requests.
+
+        Returns:
+            List[float]: Normalized entropy scores between 0 and 1, one per
+                input text, in input order.
+
+        Raises:
+            ValueError: If input is not a list of strings or None.
+        """
+        if not isinstance(texts, list) and texts is not None:
+            raise ValueError("Input must be a list of strings or None")
+
+        if not texts:
+            return []
+
+        if not all(isinstance(t, str) for t in texts):
+            raise ValueError("All elements must be strings")
+
+        async def _gather() -> List[float]:
+            sem = asyncio.Semaphore(concurrency)
+
+            async def bounded(text: str) -> float:
+                async with sem:
+                    return await self.acompute_entropy(text, client=client)
+
+            return await asyncio.gather(*(bounded(t) for t in texts))
+
+        return list(asyncio.run(_gather()))
@@ -14,7 +14,8 @@ Author: Aditya Patange (AdiPat)
 License: MIT
 """
 
-from typing import Any, Optional
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple
 from .entropy_strategy_base import EntropyStrategy
 from .text_entropy import TextEntropy
 from .numerical_entropy import NumericalEntropy
@@ -22,6 +23,37 @@ from .search_entropy import SearchEngineEntropy
 from .contextual_entropy import ContextualEntropy
 from .time_entropy import TimeEntropy
 
+# Construction is deferred to first lookup, so importing the package never
+# builds calculators nobody asked for. Most strategies are stateless and a
+# single memoized instance per type is enough; the ones carrying per-instance
+# state are listed in _STATEFUL_TYPES and built fresh per lookup, so one
+# caller's configuration can never leak into another's.
+_STRATEGY_CLASSES = {
+    "text": TextEntropy,
+    "numerical": NumericalEntropy,
+    "search": SearchEngineEntropy,
+    "contextual": ContextualEntropy,
+    "time": TimeEntropy,
+}
+
+# SearchEngineEntropy holds a fitted vectorizer: sharing one process-wide
+# instance would let any caller's fit(corpus) permanently flip every other
+# caller onto that frozen vocabulary.
+_STATEFUL_TYPES = frozenset({"search"})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_strategy(strategy_type: str) -> EntropyStrategy:
+    """Return the shared calculator for a known strategy type.
+
+    Args:
+        strategy_type: Validated strategy type name.
+
+    Returns:
+        EntropyStrategy: The memoized calculator instance.
+    """
+    return _STRATEGY_CLASSES[strategy_type]()
+
 
 class EntropyFactory:
     """Factory class for creating entropy calculator instances.
@@ -36,15 +68,42 @@ class EntropyFactory:
         if not isinstance(strategy_type, str) or strategy_type is None:
             raise ValueError("Strategy type must be a string")
 
-        strategies = {
-            "text": TextEntropy(),
-            "numerical": NumericalEntropy(),
-            "search": SearchEngineEntropy(),
-            "contextual": ContextualEntropy(),
-            "time": TimeEntropy(),
-        }
-
-        if strategy_type not in strategies:
+        if strategy_type not in _STRATEGY_CLASSES:
             raise ValueError(f"Invalid Strategy Type: {strategy_type}")
 
-        return strategies[strategy_type]
+        if strategy_type in _STATEFUL_TYPES:
+            return _STRATEGY_CLASSES[strategy_type]()
+        return _get_strategy(strategy_type)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_multi_calculator(
+        strategy_types: Tuple[str, ...]
+    ) -> Callable[[Dict[str, Any]], Dict[str, float]]:
+        """Build a fused callable that scores one record with several strategies.
+
+        Callers that compute multiple scores per record (e.g. text +
+        numerical + time) can fetch the fused callable once; the strategy
+        lookups and validation are resolved at build time and the returned
+        function dispatches straight to the bound compute methods. Callables
+        are cached per strategy tuple.
+
+        Args:
+            strategy_types: Tuple of strategy type names to fuse.
+
+        Returns:
+            Callable: Function mapping a record dict (keyed by strategy type)
+                to a dict of entropy scores with the same keys.
+
+        Raises:
+            ValueError: If any strategy type is invalid.
+        """
+        computes = tuple(
+            (name, EntropyFactory.get_entropy_calculator(name).compute_entropy)
+            for name in strategy_types
+        )
+
+        def compute_all(record: Dict[str, Any]) -> Dict[str, float]:
+            return {name: compute(record.get(name)) for name, compute in computes}
+
+        return compute_all
@@ -16,9 +16,14 @@ License: MIT
 
 from typing import List, Optional
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
 from .entropy_strategy_base import EntropyStrategy
 
+# Result lists at least this large are routed through a fixed-width hashing
+# vectorizer: char_wb vocabularies grow with the corpus, and hashing caps
+# feature-space memory regardless of result count.
+_HASHING_MIN_RESULTS = 1024
+
 
 class SearchEngineEntropy(EntropyStrategy):
     """Strategy for analyzing diversity in search engine results.
@@ -39,6 +44,38 @@ class SearchEngineEntropy(EntropyStrategy):
         >>> score = analyzer.compute_entropy(["result1", "result2", "result3"])
     """
 
+    def __init__(self):
+        self._vectorizer = None
+        self._fitted = False
+
+    def _get_vectorizer(self) -> TfidfVectorizer:
+        """Return the shared vectorizer, building it on first use.
+
+        Returns:
+            TfidfVectorizer: Character n-gram vectorizer reused across calls.
+        """
+        if self._vectorizer is None:
+            self._vectorizer = TfidfVectorizer(
+                min_df=1, analyzer="char_wb", ngram_range=(2, 3)
+            )
+        return self._vectorizer
+
+    def fit(self, corpus: List[str]) -> "SearchEngineEntropy":
+        """Pre-fit the vectorizer on a reference corpus.
+
+        Subsequent compute_entropy calls reuse the learned vocabulary via
+        transform, skipping the vocabulary-building pass per call.
+
+        Args:
+            corpus: Reference documents to learn the vocabulary from.
+
+        Returns:
+            SearchEngineEntropy: This analyzer, for chaining.
+        """
+        self._get_vectorizer().fit(corpus)
+        self._fitted = True
+        return self
+
     def compute_entropy(self, results: Optional[List[str]]) -> float:
         """Compute entropy score for a list of search results.
 
@@ -64,7 +101,22 @@ class SearchEngineEntropy(EntropyStrategy):
         if len(set(results)) == 1:
             return 0.0
 
-        vectorizer = TfidfVectorizer(min_df=1, analyzer="char_wb", ngram_range=(2, 3))
-        tfidf_matrix = vectorizer.fit_transform(results)
-        scores = tfidf_matrix.toarray().std(axis=0)
+        if len(results) >= _HASHING_MIN_RESULTS and not self._fitted:
+            hasher = HashingVectorizer(
+                analyzer="char_wb",
+                ngram_range=(2, 3),
+                n_features=2**14,
+                alternate_sign=False,
+                norm="l2",
+            )
+            tfidf_matrix = hasher.transform(results)
+        elif self._fitted:
+            tfidf_matrix = self._get_vectorizer().transform(results)
+        else:
+            tfidf_matrix = self._get_vectorizer().fit_transform(results)
+        # Column std computed as sqrt(E[X^2] - E[X]^2) directly on the sparse
+        # matrix, avoiding densification to (n_docs, n_features).
+        mean = np.asarray(tfidf_matrix.mean(axis=0)).ravel()
+        sq_mean = np.asarray(tfidf_matrix.multiply(tfidf_matrix).mean(axis=0)).ravel()
+        scores = np.sqrt(np.maximum(sq_mean - mean * mean, 0.0))
         return float(min(1.0, np.mean(scores) if scores.size > 0 else 0.0))
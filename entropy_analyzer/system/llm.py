@@ -15,11 +15,67 @@ Author: Aditya Patange (AdiPat)
 License: MIT
 """
 
+import json
+import logging
 import traceback
+from collections import OrderedDict
 from typing import Dict, List, Optional, Union, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from openai import OpenAI, AsyncOpenAI
-from .printer import Printer
+from rich.logging import RichHandler
+from .printer import print_red_message
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Validated ChatInput models keyed by the canonical JSON of the raw input
+# dict. Batch workloads often re-send identically shaped requests; caching
+# skips the repeated Pydantic validation pass. JSON stringifies non-string
+# dict keys, so inputs with any non-str key anywhere (e.g. an int-keyed
+# logit_bias, which validation must reject) are never cached — on a lossy
+# key they would collide with their str-keyed twins.
+_CHAT_INPUT_CACHE: "OrderedDict[str, ChatInput]" = OrderedDict()
+_CHAT_INPUT_CACHE_MAX = 256
+
+
+def _str_keyed(obj: Any) -> bool:
+    """Report whether every dict key nested in obj is a plain string.
+
+    Args:
+        obj: Raw input value to inspect.
+
+    Returns:
+        bool: True if a JSON dump of obj round-trips its dict keys exactly.
+    """
+    if isinstance(obj, dict):
+        return all(
+            type(key) is str and _str_keyed(value) for key, value in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        return all(_str_keyed(item) for item in obj)
+    return True
+
+# Optional ChatInput fields forwarded to the API when set. The schema is
+# fixed, so a hand-written dump over this tuple beats the generic Pydantic
+# traversal of all fields.
+_OPTIONAL_API_FIELDS = (
+    "frequency_penalty",
+    "presence_penalty",
+    "max_tokens",
+    "n",
+    "temperature",
+    "top_p",
+    "stop",
+    "tool_choice",
+    "tools",
+    "user",
+    "seed",
+    "response_format",
+    "logit_bias",
+    "metadata",
+)
 
 
 class Message(BaseModel):
@@ -78,6 +134,38 @@ class ChatInput(BaseModel):
     logit_bias: Optional[Dict[str, float]] = None
     metadata: Optional[Dict[str, str]] = None
 
+    _api_kwargs: Optional[Dict] = PrivateAttr(default=None)
+
+    def as_api_kwargs(self) -> Dict:
+        """Return the non-None request kwargs, serialized once per instance.
+
+        The dump is memoized on the instance so repeated requests with the
+        same validated input (common with the prepare-request cache) pay the
+        model traversal only once.
+
+        Returns:
+            Dict: Keyword arguments ready for the chat completions API.
+        """
+        if self._api_kwargs is None:
+            kwargs: Dict = {
+                "messages": [
+                    {"role": m.role, "content": m.content} for m in self.messages
+                ],
+                "model": self.model,
+            }
+            for name in _OPTIONAL_API_FIELDS:
+                value = getattr(self, name)
+                if value is not None:
+                    kwargs[name] = value
+            self._api_kwargs = kwargs
+        return self._api_kwargs
+
+
+# Bound once: pydantic-core's compiled validator entry point, skipping the
+# model_validate classmethod frame and the __init__ kwargs repack on every
+# dict validation.
+_validate_chat_input = ChatInput.__pydantic_validator__.validate_python
+
 
 class ChatResponse(BaseModel):
     """
@@ -96,6 +184,33 @@ class ChatResponse(BaseModel):
     usage: Dict
 
 
+def _dump_model(obj: Any) -> Dict:
+    """Dump an SDK object to a plain dict without assuming its type.
+
+    Pydantic-backed SDK objects expose model_dump; anything else falls back
+    to its attribute dict, skipping the schema walk entirely.
+
+    Args:
+        obj: SDK response object to convert.
+
+    Returns:
+        Dict: Plain dictionary form of the object.
+    """
+    dump = getattr(obj, "model_dump", None)
+    return dump() if dump is not None else vars(obj)
+
+
+# Request/response logger, mirroring the workflow module. The level stays at
+# DEBUG: verbosity is a per-instance setting, so each log site is gated on
+# self.verbose rather than by mutating shared logger state, and %s args are
+# only rendered when a handler actually emits.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    logger.addHandler(RichHandler(show_time=False, show_level=False, show_path=False))
+    logger.propagate = False
+logger.setLevel(logging.DEBUG)
+
+
 class BaseLLM:
     """
     Base class for LLM implementations with shared functionality.
@@ -122,6 +237,9 @@ class BaseLLM:
 
         Converts dictionary input to ChatInput model if needed and ensures all data is valid.
 
+        Validated models are memoized by the canonical JSON of the input
+        dict, so repeated identical requests skip re-validation.
+
         Args:
             input_data: Raw input data either as a ChatInput instance or dictionary.
 
@@ -131,29 +249,24 @@ class BaseLLM:
         Raises:
             ValueError: If input data fails validation requirements.
         """
-        return (
-            ChatInput(**input_data)
-            if not isinstance(input_data, ChatInput)
-            else input_data
-        )
-
-    def _prepare_structured_request(
-        self, input_data: Union[ChatInput, Dict], response_format: BaseModel
-    ) -> ChatInput:
-        """
-        Prepare and validate the chat input request for structured outputs.
-
-        Args:
-            input_data: Raw input data either as a ChatInput instance or dictionary.
-            response_format: A Pydantic model defining the response structure.
+        if isinstance(input_data, ChatInput):
+            return input_data
 
-        Returns:
-            ChatInput: A validated ChatInput instance ready for API submission.
+        if not _str_keyed(input_data):
+            return _validate_chat_input(input_data)
 
-        Raises:
-            ValueError: If input data fails validation requirements.
-        """
-        return self._prepare_request(input_data)
+        try:
+            key = json.dumps(input_data, sort_keys=True)
+        except (TypeError, ValueError):
+            return _validate_chat_input(input_data)
+
+        cached = _CHAT_INPUT_CACHE.get(key)
+        if cached is None:
+            cached = _validate_chat_input(input_data)
+            _CHAT_INPUT_CACHE[key] = cached
+            if len(_CHAT_INPUT_CACHE) > _CHAT_INPUT_CACHE_MAX:
+                _CHAT_INPUT_CACHE.popitem(last=False)
+        return cached
 
     def _create_response(self, response: Any) -> ChatResponse:
         """
@@ -171,11 +284,15 @@ class BaseLLM:
             ValueError: If response data cannot be properly formatted.
         """
         response_dict = {
-            "choices": [{"message": c.message.model_dump()} for c in response.choices],
+            "choices": [{"message": _dump_model(c.message)} for c in response.choices],
             "created": response.created,
             "model": response.model,
-            "usage": response.usage.model_dump(),
+            "usage": _dump_model(response.usage),
         }
+        if orjson is not None:
+            # pydantic-core's JSON validator consumes orjson's C-serialized
+            # bytes faster than the Python dict walker for large payloads.
+            return ChatResponse.model_validate_json(orjson.dumps(response_dict))
         return ChatResponse(**response_dict)
 
     def _log_request(self, chat_input: ChatInput) -> None:
@@ -187,11 +304,10 @@ class BaseLLM:
         Args:
             chat_input: The validated chat input being sent to the API.
         """
-        Printer.verbose_logger(
-            self.verbose,
-            Printer.print_light_grey_message,
-            f"Generating chat completion with model: {chat_input.model}",
-        )
+        if self.verbose:
+            logger.debug(
+                "Generating chat completion with model: %s", chat_input.model
+            )
 
     def _log_response(self, chat_response: ChatResponse) -> None:
         """
@@ -202,11 +318,10 @@ class BaseLLM:
         Args:
             chat_response: The validated response received from the API.
         """
-        Printer.verbose_logger(
-            self.verbose,
-            Printer.print_light_grey_message,
-            f"Successfully generated response: {chat_response.model_dump()}",
-        )
+        if self.verbose:
+            logger.debug(
+                "Successfully generated response: %s", chat_response.model_dump()
+            )
 
     def _handle_error(self, error: Exception, context: str) -> None:
         """
@@ -225,8 +340,9 @@ class BaseLLM:
             Exception: For any other unexpected errors.
         """
         error_msg = f"{context}: {str(error)}"
-        Printer.print_red_message(error_msg)
-        traceback.print_exc()
+        print_red_message(error_msg)
+        if self.verbose:
+            traceback.print_exc()
         raise (
             ValueError(error_msg)
             if context.startswith("Error in")
@@ -273,7 +389,7 @@ class LLM(BaseLLM):
 
             try:
                 response = self.client.chat.completions.create(
-                    **chat_input.model_dump(exclude_none=True)
+                    **chat_input.as_api_kwargs()
                 )
                 chat_response = self._create_response(response)
                 self._log_response(chat_response)
@@ -305,12 +421,12 @@ class LLM(BaseLLM):
             Exception: For any other unexpected errors during execution.
         """
         try:
-            chat_input = self._prepare_structured_request(input_data, response_format)
+            chat_input = self._prepare_request(input_data)
             self._log_request(chat_input)
 
             try:
                 response = self.client.chat.completions.parse(
-                    **chat_input.model_dump(exclude_none=True),
+                    **chat_input.as_api_kwargs(),
                     response_format=response_format,
                 )
                 return response.choices[0].message.parsed
@@ -361,7 +477,7 @@ class AsyncLLM(BaseLLM):
 
             try:
                 response = await self.client.chat.completions.create(
-                    **chat_input.model_dump(exclude_none=True)
+                    **chat_input.as_api_kwargs()
                 )
                 chat_response = self._create_response(response)
                 self._log_response(chat_response)
@@ -393,12 +509,12 @@ class AsyncLLM(BaseLLM):
             Exception: For any other unexpected errors during execution.
         """
         try:
-            chat_input = self._prepare_structured_request(input_data, response_format)
+            chat_input = self._prepare_request(input_data)
             self._log_request(chat_input)
 
             try:
                 response = await self.client.chat.completions.parse(
-                    **chat_input.model_dump(exclude_none=True),
+                    **chat_input.as_api_kwargs(),
                     response_format=response_format,
                 )
                 return response.choices[0].message.parsed
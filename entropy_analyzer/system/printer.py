@@ -18,16 +18,29 @@ Author: Aditya Patange (AdiPat)
 License: MIT
 """
 
-from rich import print as rprint
-from enum import Enum
+import sys
+from typing import Callable, Union
 
+from rich.console import Console
 
-class PrinterColor(Enum):
-    """Enumeration of available colors for terminal output.
+# Shared output console. rich.print resolves its global console on every call;
+# printing through one module-level instance skips that lookup, and soft_wrap
+# disables per-line width measurement and wrapping, which this module never
+# needs for single-line log messages. The console resolves sys.stdout lazily,
+# so stream redirection (including pytest capture) keeps working.
+_console = Console(soft_wrap=True)
+_print = _console.print
 
-    This enum defines all available colors that can be used for terminal output.
-    The values correspond to Rich's color names and are used directly in the
-    Rich markup syntax.
+
+class PrinterColor:
+    """Namespace of available colors for terminal output.
+
+    This class defines all available colors that can be used for terminal
+    output as plain string constants. The values correspond to Rich's color
+    names and are used directly in the Rich markup syntax. A plain class is
+    used instead of an Enum because attribute access on Enum members goes
+    through a descriptor and is several times slower, and no member
+    iteration or identity semantics are needed here.
     """
 
     DEFAULT = "bright_white"
@@ -236,273 +249,140 @@ class PrinterColor(Enum):
     GREY93 = "grey93"
 
 
-class Printer:
-    """Terminal output management system using Rich.
+# Rich markup open/close tags precomputed per color name, so print_message
+# avoids an f-string build per call. The tags are interned: interned strings
+# cache their hash and compare by pointer first, which speeds up Rich's
+# internal style-cache lookups keyed on them.
+_MARKUP = {
+    color: (sys.intern(f"[{color}]"), sys.intern(f"[/{color}]"))
+    for name, color in vars(PrinterColor).items()
+    if not name.startswith("_")
+}
+
+
+def verbose_logger(
+    verbose: bool,
+    print_method: callable,
+    message: Union[str, Callable[[], str]],
+) -> None:
+    """Conditionally execute a print method based on verbose flag.
+
+    This function provides conditional printing capability, executing the
+    provided print method only when verbose is True and the message is
+    non-empty. The message may be given as a zero-argument callable, which is
+    only invoked after the verbose check passes — callers can defer expensive
+    formatting (e.g. repr of large models) so non-verbose runs pay nothing
+    for it.
+
+    Args:
+        verbose: Boolean flag controlling whether to print.
+        print_method: Callable print function to execute.
+        message: The message to be printed, or a callable producing it.
+
+    Example:
+        >>> verbose_logger(True, print_blue_message, lambda: "Debug info").
+    """
+    if not verbose:
+        return
+    if callable(message):
+        message = message()
+    # isspace() is an allocation-free C scan that bails on the first
+    # non-space character, unlike strip(), which builds a new string
+    # just to be truth-tested.
+    if message and not message.isspace():
+        print_method(message)
 
-    This class provides a collection of static methods for printing colored output
-    to the terminal. It supports both direct color printing and verbose-aware logging
-    capabilities.
 
-    The class is designed to be used statically and provides:
-    - Color-specific printing methods.
-    - Verbose logging control.
-    - Input validation.
-    - Rich markup handling.
-    """
+def print_message(message: str, color: str = PrinterColor.DEFAULT) -> None:
+    """Print a message with specified color using Rich markup.
 
-    @staticmethod
-    def verbose_logger(verbose: bool, print_method: callable, message: str) -> None:
-        """Conditionally execute a print method based on verbose flag.
+    This core printing function handles the application of color to messages
+    using Rich's markup syntax. It validates input and applies the specified
+    color to the message.
 
-        This method provides conditional printing capability, executing the provided
-        print method only when verbose is True and the message is non-empty.
+    Args:
+        message: The text message to print.
+        color: Rich color name (typically a PrinterColor constant).
 
-        Args:
-            verbose: Boolean flag controlling whether to print.
-            print_method: Callable print function to execute.
-            message: The message to be printed.
+    Raises:
+        TypeError: If the message parameter is not a string.
 
-        Example:
-            >>> Printer.verbose_logger(True, Printer.print_blue_message, "Debug info").
-        """
-        if verbose and message and message.strip():
-            print_method(message)
+    Example:
+        >>> print_message("Hello", PrinterColor.BLUE).
+    """
+    if not isinstance(message, str):
+        raise TypeError("Message must be a string")
+    tags = _MARKUP.get(color)
+    if tags is None:
+        tags = (f"[{color}]", f"[/{color}]")
+    _print(tags[0] + message + tags[1])
 
-    @staticmethod
-    def print_message(message: str, color: PrinterColor = PrinterColor.DEFAULT) -> None:
-        """Print a message with specified color using Rich markup.
 
-        This core printing method handles the application of color to messages
-        using Rich's markup syntax. It validates input and applies the specified
-        color to the message.
+def _make_print_method(label: str, color: str):
+    """Build a color-bound print helper with its markup tags precomputed.
 
-        Args:
-            message: The text message to print.
-            color: PrinterColor enum value specifying the color to use.
+    Args:
+        label: Human-readable color label used in the helper's name and doc.
+        color: Rich color name the helper prints with.
 
-        Raises:
-            TypeError: If the message parameter is not a string.
+    Returns:
+        callable: A print helper bound to the given color.
+    """
+    open_tag, close_tag = _MARKUP[color]
 
-        Example:
-            >>> Printer.print_message("Hello", PrinterColor.BLUE).
-        """
+    def print_colored(message: str) -> None:
         if not isinstance(message, str):
             raise TypeError("Message must be a string")
-        rprint(f"[{color.value}]{message}[/{color.value}]")
-
-    # Color-specific printing methods
-    @staticmethod
-    def print_orange_message(message: str) -> None:
-        """Print a message in orange color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_orange_message("Warning message").
-        """
-        Printer.print_message(message, PrinterColor.DARK_ORANGE3)
-
-    @staticmethod
-    def print_blue_message(message: str) -> None:
-        """Print a message in blue color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_blue_message("Information message").
-        """
-        Printer.print_message(message, PrinterColor.BLUE)
-
-    @staticmethod
-    def print_green_message(message: str) -> None:
-        """Print a message in green color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_green_message("Success message").
-        """
-        Printer.print_message(message, PrinterColor.GREEN)
-
-    @staticmethod
-    def print_red_message(message: str) -> None:
-        """Print a message in red color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_red_message("Error message").
-        """
-        Printer.print_message(message, PrinterColor.RED)
-
-    @staticmethod
-    def print_yellow_message(message: str) -> None:
-        """Print a message in yellow color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_yellow_message("Warning message").
-        """
-        Printer.print_message(message, PrinterColor.YELLOW)
-
-    @staticmethod
-    def print_magenta_message(message: str) -> None:
-        """Print a message in magenta color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_magenta_message("Notice message").
-        """
-        Printer.print_message(message, PrinterColor.MAGENTA)
+        _print(open_tag + message + close_tag)
 
-    @staticmethod
-    def print_cyan_message(message: str) -> None:
-        """Print a message in cyan color.
+    print_colored.__name__ = f"print_{label}_message"
+    print_colored.__qualname__ = f"print_{label}_message"
+    print_colored.__doc__ = (
+        f"Print a message in {label.replace('_', ' ')} color.\n\n"
+        "Args:\n"
+        "    message: The text message to print.\n"
+    )
+    return print_colored
 
-        Args:
-            message: The text message to print.
 
-        Example:
-            >>> Printer.print_cyan_message("Info message").
-        """
-        Printer.print_message(message, PrinterColor.CYAN)
-
-    @staticmethod
-    def print_white_message(message: str) -> None:
-        """Print a message in white color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_white_message("Default message").
-        """
-        Printer.print_message(message, PrinterColor.WHITE)
-
-    @staticmethod
-    def print_bright_black_message(message: str) -> None:
-        """Print a message in bright black color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_bright_black_message("Subtle message").
-        """
-        Printer.print_message(message, PrinterColor.BRIGHT_BLACK)
-
-    @staticmethod
-    def print_bright_red_message(message: str) -> None:
-        """Print a message in bright red color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_bright_red_message("Alert message").
-        """
-        Printer.print_message(message, PrinterColor.BRIGHT_RED)
-
-    @staticmethod
-    def print_bright_green_message(message: str) -> None:
-        """Print a message in bright green color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_bright_green_message("Success message").
-        """
-        Printer.print_message(message, PrinterColor.BRIGHT_GREEN)
-
-    @staticmethod
-    def print_bright_yellow_message(message: str) -> None:
-        """Print a message in bright yellow color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_bright_yellow_message("Warning message").
-        """
-        Printer.print_message(message, PrinterColor.BRIGHT_YELLOW)
-
-    @staticmethod
-    def print_bright_blue_message(message: str) -> None:
-        """Print a message in bright blue color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_bright_blue_message("Information message").
-        """
-        Printer.print_message(message, PrinterColor.BRIGHT_BLUE)
-
-    @staticmethod
-    def print_bright_magenta_message(message: str) -> None:
-        """Print a message in bright magenta color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_bright_magenta_message("Notice message").
-        """
-        Printer.print_message(message, PrinterColor.BRIGHT_MAGENTA)
-
-    @staticmethod
-    def print_bright_cyan_message(message: str) -> None:
-        """Print a message in bright cyan color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_bright_cyan_message("Info message").
-        """
-        Printer.print_message(message, PrinterColor.BRIGHT_CYAN)
-
-    @staticmethod
-    def print_bright_white_message(message: str) -> None:
-        """Print a message in bright white color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_bright_white_message("Default message").
-        """
-        Printer.print_message(message, PrinterColor.BRIGHT_WHITE)
-
-    @staticmethod
-    def print_light_grey_message(message: str) -> None:
-        """Print a message in light grey color.
-
-        Args:
-            message: The text message to print.
-
-        Example:
-            >>> Printer.print_light_grey_message("Subtle message").
-        """
-        Printer.print_message(message, PrinterColor.GREY0)
-
-    @staticmethod
-    def print_navy_blue_message(message: str) -> None:
-        """Print a message in navy blue color.
+class Printer:
+    """Terminal output management system using Rich.
 
-        Args:
-            message: The text message to print.
+    This class is a thin namespace over the module-level print functions, kept
+    for backwards compatibility. Internal callers import the functions
+    directly: module-level calls resolve through one global lookup, where the
+    class attribute path costs an extra dict lookup per call.
+    """
 
-        Example:
-            >>> Printer.print_navy_blue_message("Information message").
-        """
-        Printer.print_message(message, PrinterColor.NAVY_BLUE)
+    verbose_logger = staticmethod(verbose_logger)
+    print_message = staticmethod(print_message)
+
+
+# Color-specific print helpers. Generated once at import time with their
+# markup tags captured in the closure, so each call is a single function
+# invocation instead of a dispatch through print_message plus a table lookup.
+# Each helper is bound both at module level and onto the Printer namespace.
+for _label, _color in (
+    ("orange", PrinterColor.DARK_ORANGE3),
+    ("blue", PrinterColor.BLUE),
+    ("green", PrinterColor.GREEN),
+    ("red", PrinterColor.RED),
+    ("yellow", PrinterColor.YELLOW),
+    ("magenta", PrinterColor.MAGENTA),
+    ("cyan", PrinterColor.CYAN),
+    ("white", PrinterColor.WHITE),
+    ("bright_black", PrinterColor.BRIGHT_BLACK),
+    ("bright_red", PrinterColor.BRIGHT_RED),
+    ("bright_green", PrinterColor.BRIGHT_GREEN),
+    ("bright_yellow", PrinterColor.BRIGHT_YELLOW),
+    ("bright_blue", PrinterColor.BRIGHT_BLUE),
+    ("bright_magenta", PrinterColor.BRIGHT_MAGENTA),
+    ("bright_cyan", PrinterColor.BRIGHT_CYAN),
+    ("bright_white", PrinterColor.BRIGHT_WHITE),
+    ("light_grey", PrinterColor.GREY0),
+    ("navy_blue", PrinterColor.NAVY_BLUE),
+):
+    _method = _make_print_method(_label, _color)
+    globals()[_method.__name__] = _method
+    setattr(Printer, _method.__name__, staticmethod(_method))
+del _label, _color, _method
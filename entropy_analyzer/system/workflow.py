@@ -18,12 +18,24 @@ Author: Aditya Patange (AdiPat)
 License: MIT
 """
 
+import logging
 import traceback
 import uuid
 from typing import Any, Dict, Optional, TypeVar, Generic, Union
 from abc import ABC, abstractmethod
 from pydantic import BaseModel
-from .printer import Printer
+from rich.logging import RichHandler
+from .printer import print_red_message
+
+# Workflow execution logger. The level stays at DEBUG: verbosity is a
+# per-instance setting, so each log site is gated on self.verbose rather
+# than by mutating shared logger state, and the %s interpolation in log
+# calls is deferred until a handler runs.
+logger = logging.getLogger("entropy_analyzer.workflow")
+if not logger.handlers:
+    logger.addHandler(RichHandler(show_time=False, show_level=False, show_path=False))
+    logger.propagate = False
+logger.setLevel(logging.DEBUG)
 
 
 I = TypeVar("I", bound=BaseModel)
@@ -31,6 +43,43 @@ T = TypeVar("T", bound=BaseModel)
 R = TypeVar("R")
 
 
+def _make_coercer(model, validate: bool):
+    """Build a coercion function specialized for one model and policy.
+
+    The model and validation flag are fixed per workflow instance, so the
+    branches on them are resolved once here instead of on every run() call;
+    the returned closure only dispatches on the value's type. Returns None
+    when no model is configured, letting run() skip coercion with a single
+    None check.
+
+    Args:
+        model: Pydantic model class to coerce into, or None.
+        validate: When False, dicts are wrapped with model_construct
+            instead of being validated.
+
+    Returns:
+        Optional[callable]: The specialized coercer, or None if model is None.
+    """
+    if model is None:
+        return None
+    if validate:
+        coerce_dict = model.model_validate
+    else:
+        def coerce_dict(data, _construct=model.model_construct):
+            return _construct(**data)
+
+    def coerce(value):
+        # Exact-type check first: dict is the common case, and the pointer
+        # compare avoids Pydantic's metaclass __instancecheck__.
+        if type(value) is dict:
+            return coerce_dict(value)
+        if isinstance(value, model):
+            return value
+        return model(**value)
+
+    return coerce
+
+
 class BaseWorkflow(ABC, Generic[I, T, R]):
     """Base abstract class for creating workflow implementations.
 
@@ -56,6 +105,8 @@ class BaseWorkflow(ABC, Generic[I, T, R]):
         input_model: Optional[type[I]] = None,
         output_model: Optional[type[T]] = None,
         verbose: bool = False,
+        validate_input: bool = True,
+        validate_output: bool = True,
     ):
         """Initialize a new workflow instance.
 
@@ -71,26 +122,55 @@ class BaseWorkflow(ABC, Generic[I, T, R]):
                          output data structure.
             verbose: When True, enables detailed debug logging for the workflow
                     execution.
+            validate_input: When False, dict inputs are wrapped with
+                           model_construct instead of being validated. Only
+                           safe for trusted callers that pre-validate data.
+            validate_output: When False, dict results from _run_workflow are
+                            wrapped with model_construct instead of being
+                            validated.
 
         Raises:
             RuntimeError: If initialization fails due to invalid arguments.
         """
-        try:
-            if workflow_id is not None and not isinstance(workflow_id, str):
-                raise ValueError(
-                    f"Invalid workflow ID type [{workflow_id}]. Only strings allowed."
-                )
-            self.workflow_id = workflow_id or str(uuid.uuid4())
-            self.name = name
-            self.description = description
-            self.input_model = input_model
-            self.output_model = output_model
-            self.verbose = verbose
+        if workflow_id is not None and not isinstance(workflow_id, str):
+            raise RuntimeError(
+                f"Failed to initialize workflow: Invalid workflow ID type "
+                f"[{workflow_id}]. Only strings allowed.."
+            )
+        self._workflow_id = workflow_id or None
+        self.name = name
+        self.description = description
+        self.input_model = input_model
+        self.output_model = output_model
+        self.verbose = verbose
+        self.validate_input = validate_input
+        self.validate_output = validate_output
+        self._coerce_input = _make_coercer(input_model, validate_input)
+        self._coerce_output = _make_coercer(output_model, validate_output)
+
+    @property
+    def workflow_id(self) -> str:
+        """Unique identifier for the workflow, generated on first access.
+
+        uuid.uuid4() reads from the OS entropy pool, so the generation is
+        deferred until something actually reads the id; workflows that are
+        constructed, run non-verbose, and discarded never pay for it.
 
-        except Exception as e:
-            Printer.print_red_message(f"Failed to initialize workflow: {str(e)}.")
-            traceback.print_exc()
-            raise RuntimeError(f"Failed to initialize workflow: {str(e)}.") from e
+        Returns:
+            str: The workflow's unique identifier.
+        """
+        if self._workflow_id is None:
+            self._workflow_id = str(uuid.uuid4())
+        return self._workflow_id
+
+    @workflow_id.setter
+    def workflow_id(self, value: str) -> None:
+        """Set the workflow identifier, as on the plain attribute it replaces.
+
+        Args:
+            value: The identifier to assign.
+        """
+        self._workflow_id = value
 
     def run(self, input_data: Union[I, Dict, Any]) -> Union[Dict, T, R]:
         """Execute the workflow with the given input data.
@@ -114,74 +194,51 @@ class BaseWorkflow(ABC, Generic[I, T, R]):
             SystemError: If workflow fails due to an unexpected error.
         """
         try:
-            if self.input_model:
+            if self._coerce_input is not None:
                 try:
-                    input_data = (
-                        self.input_model(**input_data)
-                        if not isinstance(input_data, self.input_model)
-                        else input_data
-                    )
+                    input_data = self._coerce_input(input_data)
                 except Exception as e:
-                    Printer.print_red_message(f"Input validation failed: {str(e)}.")
-                    Printer.print_red_message(f"Input data: {input_data}.")
-                    traceback.print_exc()
+                    print_red_message(f"Input validation failed: {str(e)}.")
+                    print_red_message(f"Input data: {input_data}.")
+                    if self.verbose:
+                        traceback.print_exc()
                     raise ValueError(f"Invalid input data: {str(e)}.") from e
 
-            Printer.verbose_logger(
-                self.verbose,
-                Printer.print_light_grey_message,
-                f"Starting workflow: {self.name} ({self.workflow_id}).",
-            )
-
-            Printer.verbose_logger(
-                self.verbose,
-                Printer.print_light_grey_message,
-                f"Input data: {input_data}.",
-            )
-
-            Printer.verbose_logger(
-                self.verbose,
-                Printer.print_light_grey_message,
-                f"Description: {self.description}.",
-            )
+            if self.verbose:
+                logger.debug("Starting workflow: %s (%s).", self.name, self.workflow_id)
+                # %.256r defers the repr to handler emit time and caps how
+                # much of a large model gets formatted into the log line.
+                logger.debug("Input data: %.256r.", input_data)
+                logger.debug("Description: %s.", self.description)
 
             try:
                 result = self._run_workflow(input_data)
             except Exception as e:
-                Printer.print_red_message(f"Workflow execution failed: {str(e)}.")
-                traceback.print_exc()
+                print_red_message(f"Workflow execution failed: {str(e)}.")
+                if self.verbose:
+                    traceback.print_exc()
                 raise RuntimeError(f"Workflow execution failed: {str(e)}.") from e
 
-            if self.output_model:
+            if self._coerce_output is not None:
                 try:
-                    result = (
-                        self.output_model(**result)
-                        if not isinstance(result, self.output_model)
-                        else result
-                    )
+                    result = self._coerce_output(result)
                 except Exception as e:
-                    Printer.print_red_message(f"Output validation failed: {str(e)}.")
-                    Printer.print_red_message(f"Output data: {result}.")
-                    traceback.print_exc()
+                    print_red_message(f"Output validation failed: {str(e)}.")
+                    print_red_message(f"Output data: {result}.")
+                    if self.verbose:
+                        traceback.print_exc()
                     raise ValueError(f"Invalid output data: {str(e)}.") from e
 
-            Printer.verbose_logger(
-                self.verbose,
-                Printer.print_light_grey_message,
-                f"Workflow result: {result}.",
-            )
-
-            Printer.verbose_logger(
-                self.verbose,
-                Printer.print_light_grey_message,
-                f"Workflow completed successfully: {self.name}.",
-            )
+            if self.verbose:
+                logger.debug("Workflow result: %.256r.", result)
+                logger.debug("Workflow completed successfully: %s.", self.name)
 
             return result
 
         except Exception as e:
-            Printer.print_red_message(f"Workflow failed: {str(e)}.")
-            traceback.print_exc()
+            print_red_message(f"Workflow failed: {str(e)}.")
+            if self.verbose:
+                traceback.print_exc()
             raise SystemError(f"Workflow failed: {str(e)}.") from e
 
     @abstractmethod
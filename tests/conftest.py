@@ -0,0 +1,13 @@
+import asyncio
+
+import pytest
+
+
+# pytest-asyncio's default event_loop fixture is function-scoped, so every
+# async test pays selector and loop setup/teardown. One loop shared across
+# the session amortizes that over the whole async suite.
+@pytest.fixture(scope="session")
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import patch, MagicMock, Mock, AsyncMock
 from pydantic import BaseModel
 from openai import OpenAI
 from entropy_analyzer.strategies.contextual_entropy import ContextualEntropy
@@ -80,3 +80,125 @@ def test_contextual_entropy_api_failure(mock_openai_cls):
     analyzer = ContextualEntropy()
     score = analyzer.compute_entropy("test text", client=mock_client)
     assert 0 <= score <= 1
+
+
+def _mock_content_response(content):
+    return Mock(choices=[Mock(message=Mock(content=content))])
+
+
+def test_contextual_entropy_batch_success():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _mock_content_response(
+        "3\n5\n7"
+    )
+    analyzer = ContextualEntropy()
+    scores = analyzer.compute_entropy_batch(["a", "b", "c"], client=mock_client)
+    assert scores == [0.3, 0.5, 0.7]
+    mock_client.chat.completions.create.assert_called_once()
+
+
+def test_contextual_entropy_batch_matches_single_scale():
+    # Both paths prompt for 0-9 ratings and divide by 10, so the same
+    # model rating must map to the same score either way.
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _mock_content_response("9")
+    analyzer = ContextualEntropy()
+    single = analyzer.compute_entropy("test text", client=mock_client)
+    batch = analyzer.compute_entropy_batch(["test text"], client=mock_client)
+    assert batch == [single] == [0.9]
+
+
+def test_contextual_entropy_batch_count_mismatch_falls_back():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = _mock_content_response("3\n5")
+    analyzer = ContextualEntropy()
+    texts = ["hello", "world", "testing"]
+    scores = analyzer.compute_entropy_batch(texts, client=mock_client)
+    assert len(scores) == 3
+    assert all(0 <= s <= 1 for s in scores)
+
+
+def test_contextual_entropy_batch_api_failure():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.side_effect = Exception("API Error")
+    analyzer = ContextualEntropy()
+    scores = analyzer.compute_entropy_batch(["hello", "world"], client=mock_client)
+    assert len(scores) == 2
+    assert all(0 <= s <= 1 for s in scores)
+
+
+def test_contextual_entropy_batch_edge_cases():
+    analyzer = ContextualEntropy()
+    assert analyzer.compute_entropy_batch(None) == []
+    assert analyzer.compute_entropy_batch([]) == []
+
+
+def test_contextual_entropy_batch_invalid_input():
+    analyzer = ContextualEntropy()
+    with pytest.raises(ValueError, match="Input must be a list of strings or None"):
+        analyzer.compute_entropy_batch("not a list")
+    with pytest.raises(ValueError, match="All elements must be strings"):
+        analyzer.compute_entropy_batch(["ok", 123])
+
+
+@pytest.mark.asyncio
+async def test_contextual_entropy_async_api_success():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(
+        return_value=_mock_content_response("7")
+    )
+    analyzer = ContextualEntropy()
+    score = await analyzer.acompute_entropy("test text", client=mock_client)
+    assert score == 0.7
+    mock_client.chat.completions.create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_contextual_entropy_async_api_failure():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+    analyzer = ContextualEntropy()
+    score = await analyzer.acompute_entropy("test text", client=mock_client)
+    assert 0 <= score <= 1
+
+
+@pytest.mark.asyncio
+async def test_contextual_entropy_async_edge_cases():
+    analyzer = ContextualEntropy()
+    assert await analyzer.acompute_entropy(None) == 0.0
+    assert await analyzer.acompute_entropy("") == 0.0
+    with pytest.raises(ValueError, match="Input must be a string or None"):
+        await analyzer.acompute_entropy(123)
+
+
+# compute_entropy_many drives its own event loop via asyncio.run, so these
+# tests stay synchronous; an async test would already be inside a loop.
+def test_contextual_entropy_many_preserves_order():
+    async def fake_create(**kwargs):
+        text = kwargs["messages"][1]["content"]
+        return _mock_content_response(str(len(text)))
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = fake_create
+    analyzer = ContextualEntropy()
+    scores = analyzer.compute_entropy_many(["a", "bb", "ccc"], client=mock_client)
+    assert scores == [0.1, 0.2, 0.3]
+
+
+def test_contextual_entropy_many_api_failure():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+    analyzer = ContextualEntropy()
+    scores = analyzer.compute_entropy_many(["hello", "world"], client=mock_client)
+    assert len(scores) == 2
+    assert all(0 <= s <= 1 for s in scores)
+
+
+def test_contextual_entropy_many_edge_cases():
+    analyzer = ContextualEntropy()
+    assert analyzer.compute_entropy_many(None) == []
+    assert analyzer.compute_entropy_many([]) == []
+    with pytest.raises(ValueError, match="Input must be a list of strings or None"):
+        analyzer.compute_entropy_many("not a list")
+    with pytest.raises(ValueError, match="All elements must be strings"):
+        analyzer.compute_entropy_many(["ok", None])
@@ -2,7 +2,7 @@ import pytest
 from entropy_analyzer.strategies import EntropyFactory
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def entropy_calculators():
     return {
         "text": EntropyFactory.get_entropy_calculator("text"),
@@ -55,12 +55,27 @@ def test_factory_invalid_type():
         EntropyFactory.get_entropy_calculator(None)
 
 
-def test_text_entropy_invalid_input(entropy_calculators):
-    calc = entropy_calculators["text"]
-    with pytest.raises(ValueError, match="Input must be a string or None"):
-        calc.compute_entropy(123)
-    with pytest.raises(ValueError, match="Input must be a string or None"):
-        calc.compute_entropy([1, 2, 3])
+@pytest.mark.parametrize(
+    "strategy,bad_input,match",
+    [
+        ("text", 123, "Input must be a string or None"),
+        ("text", [1, 2, 3], "Input must be a string or None"),
+        ("numerical", "123", "Input must be a list of numbers or None"),
+        ("numerical", [1, float("inf"), 3], "Input contains non-finite values"),
+        ("numerical", [1, "2", 3], None),
+        ("numerical", [[1, 2], [3, 4]], "All elements must be numbers"),
+        ("search", "not a list", "Input must be a list of strings or None"),
+        ("search", [1, 2, 3], None),
+        ("contextual", 123, "Input must be a string or None"),
+        ("contextual", ["list"], "Input must be a string or None"),
+        ("time", "2023-01-01", "Input must be a list of timestamp strings or None"),
+        ("time", ["invalid date", "2023-01-01"], None),
+        ("time", ["2023-13-01"], None),  # Invalid month
+    ],
+)
+def test_invalid_input(entropy_calculators, strategy, bad_input, match):
+    with pytest.raises(ValueError, match=match):
+        entropy_calculators[strategy].compute_entropy(bad_input)
 
 
 def test_text_entropy_special_cases(entropy_calculators):
@@ -73,16 +88,6 @@ def test_text_entropy_special_cases(entropy_calculators):
     assert calc.compute_entropy("\n\t\r ") > 0  # Whitespace chars
 
 
-def test_numerical_entropy_invalid_input(entropy_calculators):
-    calc = entropy_calculators["numerical"]
-    with pytest.raises(ValueError, match="Input must be a list of numbers or None"):
-        calc.compute_entropy("123")
-    with pytest.raises(ValueError, match="Input contains non-finite values"):
-        calc.compute_entropy([1, float("inf"), 3])
-    with pytest.raises(ValueError):
-        calc.compute_entropy([1, "2", 3])
-
-
 def test_numerical_entropy_special_cases(entropy_calculators):
     calc = entropy_calculators["numerical"]
     assert calc.compute_entropy(None) == 0.0
@@ -91,14 +96,6 @@ def test_numerical_entropy_special_cases(entropy_calculators):
     assert calc.compute_entropy([0.0000001, 0.0000002]) > 0  # Small numbers
 
 
-def test_search_entropy_invalid_input(entropy_calculators):
-    calc = entropy_calculators["search"]
-    with pytest.raises(ValueError, match="Input must be a list of strings or None"):
-        calc.compute_entropy("not a list")
-    with pytest.raises(ValueError):
-        calc.compute_entropy([1, 2, 3])
-
-
 def test_search_entropy_special_cases(entropy_calculators):
     calc = entropy_calculators["search"]
     assert calc.compute_entropy(None) == 0.0
@@ -110,26 +107,6 @@ def test_search_entropy_special_cases(entropy_calculators):
     assert calc.compute_entropy(["hello!", "hello?", "hello..."]) > 0
 
 
-def test_contextual_entropy_invalid_input(entropy_calculators):
-    calc = entropy_calculators["contextual"]
-    with pytest.raises(ValueError, match="Input must be a string or None"):
-        calc.compute_entropy(123)
-    with pytest.raises(ValueError, match="Input must be a string or None"):
-        calc.compute_entropy(["list"])
-
-
-def test_time_entropy_invalid_input(entropy_calculators):
-    calc = entropy_calculators["time"]
-    with pytest.raises(
-        ValueError, match="Input must be a list of timestamp strings or None"
-    ):
-        calc.compute_entropy("2023-01-01")
-    with pytest.raises(ValueError):
-        calc.compute_entropy(["invalid date", "2023-01-01"])
-    with pytest.raises(ValueError):
-        calc.compute_entropy(["2023-13-01"])  # Invalid month
-
-
 def test_time_entropy_special_cases(entropy_calculators):
     calc = entropy_calculators["time"]
     assert calc.compute_entropy(None) == 0.0
@@ -186,3 +163,23 @@ def test_large_inputs(entropy_calculators):
                 assert 0 <= calc.compute_entropy(results) <= 1
         except Exception as e:
             pytest.fail(f"Large input failed for {calc_type}: {str(e)}")
+
+
+def test_multi_calculator():
+    compute_all = EntropyFactory.get_multi_calculator(("text", "numerical"))
+    scores = compute_all({"text": "hello world", "numerical": [1, 2, 3, 4]})
+    assert set(scores) == {"text", "numerical"}
+    assert all(0 <= s <= 1 for s in scores.values())
+    # Keys absent from the record score as empty input
+    assert compute_all({"text": "hello world"})["numerical"] == 0.0
+
+
+def test_multi_calculator_caching():
+    first = EntropyFactory.get_multi_calculator(("text", "time"))
+    second = EntropyFactory.get_multi_calculator(("text", "time"))
+    assert first is second
+
+
+def test_multi_calculator_invalid_type():
+    with pytest.raises(ValueError, match="Invalid Strategy Type: bogus"):
+        EntropyFactory.get_multi_calculator(("text", "bogus"))
@@ -32,3 +32,14 @@ def test_numerical_entropy_invalid_input():
         analyzer.compute_entropy([1, float("inf"), 3])
     with pytest.raises(ValueError):
         analyzer.compute_entropy([1, float("nan"), 3])
+
+
+def test_numerical_entropy_configurable_bins():
+    data = list(np.linspace(0.0, 1.0, 256))
+    coarse = NumericalEntropy(bins=4).compute_entropy(data)
+    fine = NumericalEntropy(bins=128).compute_entropy(data)
+    assert 0 < coarse <= 1
+    assert 0 < fine <= 1
+    # More bins resolve more structure in an evenly spread sample
+    assert coarse < fine
+    assert NumericalEntropy(bins=8).bins == 8
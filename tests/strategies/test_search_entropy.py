@@ -35,3 +35,24 @@ def test_search_entropy_invalid_input():
         analyzer.compute_entropy([1, 2, 3])
     with pytest.raises(ValueError):
         analyzer.compute_entropy(["text", None, "text"])
+
+
+def test_search_entropy_prefitted():
+    corpus = [
+        "apple computer technology",
+        "apple fruit healthy",
+        "apple records music",
+    ]
+    analyzer = SearchEngineEntropy().fit(corpus)
+    score = analyzer.compute_entropy(corpus)
+    assert 0 <= score <= 1
+    # Fitted analyzers keep the usual contracts
+    assert analyzer.compute_entropy(["same"] * 3) == 0.0
+    assert analyzer.compute_entropy([]) == 0.0
+
+
+def test_search_entropy_fit_does_not_leak_across_instances():
+    fitted = SearchEngineEntropy().fit(["reference corpus text"])
+    fresh = SearchEngineEntropy()
+    assert fitted._fitted is True
+    assert fresh._fitted is False
@@ -0,0 +1,33 @@
+import pytest
+from unittest.mock import Mock
+
+
+# Built once per session: each of these chains ~5 Mock constructions, which
+# previously ran at module import on every collection.
+@pytest.fixture(scope="session")
+def mock_api_response():
+    return Mock(
+        choices=[
+            Mock(
+                message=Mock(
+                    model_dump=lambda: {"role": "assistant", "content": "Hi there!"}
+                )
+            )
+        ],
+        created=1234567890,
+        model="gpt-3.5-turbo",
+        usage=Mock(model_dump=lambda: {"total_tokens": 10}),
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_structured_response():
+    return Mock(
+        choices=[
+            Mock(
+                message=Mock(
+                    parsed={"name": "test", "value": 42, "tags": ["tag1", "tag2"]}
+                )
+            )
+        ]
+    )
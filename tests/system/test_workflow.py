@@ -147,3 +147,42 @@ def test_workflow_initialization_error():
             output_model=TestOutputModel,
         )
     assert "Invalid workflow ID type" in str(exc_info.value)
+
+
+def test_workflow_validates_input_by_default():
+    workflow = SuccessWorkflow(input_model=TestInputModel, output_model=TestOutputModel)
+    with pytest.raises(SystemError) as exc_info:
+        workflow.run({"name": "John", "age": "thirty"})
+    assert "Invalid input data" in str(exc_info.value)
+
+
+def test_workflow_skips_input_validation_when_disabled():
+    workflow = SuccessWorkflow(
+        input_model=TestInputModel,
+        output_model=TestOutputModel,
+        validate_input=False,
+    )
+    # The mistyped age would fail validation; model_construct wraps it as-is
+    result = workflow.run({"name": "John", "age": "thirty"})
+    assert isinstance(result, TestOutputModel)
+    assert result.message == "Hello John, age thirty"
+
+
+def test_workflow_skips_output_validation_when_disabled():
+    class BadOutputWorkflow(BaseWorkflow[TestInputModel, TestOutputModel, Dict]):
+        def _run_workflow(self, input_data: TestInputModel) -> Dict:
+            return {"message": "done", "status": "maybe"}
+
+    strict = BadOutputWorkflow(input_model=TestInputModel, output_model=TestOutputModel)
+    with pytest.raises(SystemError) as exc_info:
+        strict.run({"name": "John", "age": 30})
+    assert "Invalid output data" in str(exc_info.value)
+
+    relaxed = BadOutputWorkflow(
+        input_model=TestInputModel,
+        output_model=TestOutputModel,
+        validate_output=False,
+    )
+    result = relaxed.run({"name": "John", "age": 30})
+    assert isinstance(result, TestOutputModel)
+    assert result.status == "maybe"